@@ -3,6 +3,12 @@ import tkinter as tk
 from tkinter import ttk, messagebox, simpledialog
 import sqlite3
 import datetime
+import time
+import json
+import argparse
+import functools
+from contextlib import contextmanager
+from decimal import Decimal, InvalidOperation, ROUND_HALF_UP
 import os
 import webbrowser
 
@@ -17,59 +23,268 @@ FONT_TEXT = ("Roboto", 16)
 FONT_BTN = ("Roboto", 16, "bold")
 ROW_HEIGHT = 40
 
-class DatabaseManager:
-    def __init__(self, db_name="restaurante.db"):
-        self.db_name = db_name
-        self.init_db()
+# --- DINERO ---
+# Los montos se guardan como enteros en centavos; solo se convierten a Q al mostrarlos.
+def to_cents(monto):
+    try:
+        valor = Decimal(str(monto).strip())
+        if not valor.is_finite():
+            raise InvalidOperation
+        return int((valor * 100).quantize(Decimal("1"), rounding=ROUND_HALF_UP))
+    except InvalidOperation:
+        raise ValueError(f"Monto inválido: {monto!r}")
+
+def format_money(centavos):
+    signo = "-" if centavos < 0 else ""
+    centavos = abs(centavos)
+    return f"{signo}Q{centavos // 100}.{centavos % 100:02d}"
+
+# --- PERFILADO DE UI (opcional) ---
+# Se activa con: python main.py --perfil [archivo.json]
+# El archivo sigue el formato "Trace Event" (abrir en chrome://tracing o ui.perfetto.dev).
+PROFILER = None
+
+class UIProfiler:
+    def __init__(self, output="perfil_ui.json", threshold_ms=100, min_ms=1):
+        self.output = output
+        self.threshold_ms = threshold_ms  # a partir de aquí se considera que la UI se congeló
+        self.min_ms = min_ms              # callbacks más cortos solo cuentan en el resumen
+        self.t0 = time.perf_counter()
+        self.events = []
+        self.stats = {}
+        self._handlers = []  # callback de Tk en curso: eventos y tiempo por fase
+        self._phases = []    # tiempo consumido por fases hijas, para calcular tiempo propio
+        self.ignored = set()  # callbacks que no se miden (p.ej. el latido del propio perfilador)
+        self._intervals = []  # (inicio, fin) de callbacks ya medidos, para descontarlos del latido
+
+    def _event(self, name, cat, start, end, **args):
+        ts = round((start - self.t0) * 1_000_000)
+        return {"name": name, "cat": cat, "ph": "X", "ts": ts,
+                "dur": round((end - self.t0) * 1_000_000) - ts, "pid": 1, "tid": 1, "args": args}
+
+    @contextmanager
+    def handler(self, name, entry=False):
+        if self._handlers:
+            actual = self._handlers[-1]
+            if entry:
+                # Acción del usuario dentro de un callback genérico de Tk/CTk: le da nombre
+                if not actual["entry"]:
+                    actual["name"], actual["entry"] = name, True
+                yield
+            else:
+                # Callback anidado (p.ej. por un update() dentro de otro callback)
+                with self.phase("tk", name):
+                    yield
+            return
+        start = time.perf_counter()
+        actual = {"name": name, "entry": entry, "start": start, "eventos": [], "fases": {}}
+        self._handlers.append(actual)
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            self._handlers.pop()
+            self._finish_handler(start, end, actual)
+
+    def _finish_handler(self, start, end, actual):
+        name = actual["name"]
+        # El tiempo en diálogos modales es espera del usuario, no trabajo de la UI
+        ms = (end - start) * 1000 - actual["fases"].get("espera", 0.0)
+        self._intervals.append((start, end))
+        st = self.stats.setdefault(name, {"llamadas": 0, "total_ms": 0.0, "max_ms": 0.0, "bloqueos": 0, "fases_ms": {}})
+        st["llamadas"] += 1
+        st["total_ms"] += ms
+        st["max_ms"] = max(st["max_ms"], ms)
+        for fase, fase_ms in actual["fases"].items():
+            st["fases_ms"][fase] = st["fases_ms"].get(fase, 0.0) + fase_ms
+        if ms < self.min_ms:
+            return
+        bloqueo = ms >= self.threshold_ms
+        self.events.append(self._event(name, "handler", start, end, bloqueo=bloqueo, activo_ms=round(ms, 1)))
+        self.events.extend(actual["eventos"])
+        if bloqueo:
+            st["bloqueos"] += 1
+            detalle = ", ".join(f"{f} {v:.0f} ms" for f, v in actual["fases"].items())
+            print(f"[perfil] {name} bloqueó la UI {ms:.0f} ms ({detalle or 'sin fases'})")
+
+    @contextmanager
+    def phase(self, kind, name):
+        self._phases.append(0.0)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            hijos = self._phases.pop()
+            if self._phases:
+                self._phases[-1] += end - start
+            event = self._event(name, kind, start, end)
+            if self._handlers:
+                fases = self._handlers[-1]["fases"]
+                fases[kind] = fases.get(kind, 0.0) + (end - start - hijos) * 1000
+                self._handlers[-1]["eventos"].append(event)
+            else:
+                # Fuera de callbacks (construcción inicial de pantallas)
+                self.events.append(event)
+
+    def check_stall(self, previous, now, interval_ms):
+        # El latido del bucle principal llegó tarde: entre "esperado" y "now" Tk no procesó eventos.
+        # Se descuenta la parte de esa ventana cubierta por callbacks ya medidos o en curso
+        # (trabajo ya reportado como callback, o espera del usuario en un diálogo).
+        esperado = previous + interval_ms / 1000
+        intervalos = list(self._intervals)
+        if self._handlers:
+            intervalos.append((self._handlers[0]["start"], now))
+        cubierto = sum(max(0.0, min(fin, now) - max(inicio, esperado)) for inicio, fin in intervalos)
+        self._intervals = [iv for iv in self._intervals if iv[1] > now]
+        retraso_ms = (now - esperado) * 1000
+        sin_atribuir_ms = retraso_ms - cubierto * 1000
+        if sin_atribuir_ms >= self.threshold_ms:
+            self.events.append(self._event("bucle principal bloqueado", "stall", esperado, now,
+                                           retraso_ms=round(retraso_ms), sin_atribuir_ms=round(sin_atribuir_ms)))
+
+    def summary(self):
+        lineas = [f"{'Callback':<45}{'Llamadas':>9}{'Total ms':>11}{'Max ms':>10}{'Bloqueos':>10}  Fases (ms)"]
+        for name, st in sorted(self.stats.items(), key=lambda kv: kv[1]["total_ms"], reverse=True):
+            fases = ", ".join(f"{f} {v:.1f}" for f, v in st["fases_ms"].items())
+            lineas.append(f"{name[:44]:<45}{st['llamadas']:>9}{st['total_ms']:>11.1f}{st['max_ms']:>10.1f}{st['bloqueos']:>10}  {fases}")
+        return "\n".join(lineas)
+
+    def export(self):
+        data = {"traceEvents": self.events,
+                "otherData": {"umbral_ms": self.threshold_ms, "callbacks": self.stats}}
+        with open(self.output, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=1)
+        return os.path.abspath(self.output)
+
+
+def profile_handler(func):
+    # Marca una acción del usuario para que el callback que la dispara lleve su nombre
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if PROFILER is None:
+            return func(*args, **kwargs)
+        with PROFILER.handler(func.__qualname__, entry=True):
+            return func(*args, **kwargs)
+    return wrapper
+
+
+def profile_phase(kind):
+    # Marca una función como fase "db", "render" o "io" del callback en curso
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if PROFILER is None:
+                return func(*args, **kwargs)
+            with PROFILER.phase(kind, func.__qualname__):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+class ProfiledCallWrapper(tk.CallWrapper):
+    # Tk invoca todos los callbacks de Python (command, bind, after) a través de CallWrapper
+    def callback_name(self):
+        qualname = getattr(self.func, "__qualname__", repr(self.func))
+        if qualname.endswith("after.<locals>.callit"):
+            # tkinter envuelve los after() en "callit", pero le copia el nombre de la función
+            return f"after: {self.func.__name__}"
+        return f"{qualname} ({self.widget})"
+
+    def __call__(self, *args):
+        if PROFILER is None:
+            return super().__call__(*args)
+        name = self.callback_name()
+        if name in PROFILER.ignored:
+            return super().__call__(*args)
+        with PROFILER.handler(name):
+            return super().__call__(*args)
+
+
+class ProfiledDialogs:
+    # messagebox/simpledialog corren un bucle de Tk anidado mientras el usuario lee:
+    # ese tiempo se mide como fase "espera" y no cuenta como bloqueo
+    def __init__(self, module):
+        self.module = module
+
+    def __getattr__(self, name):
+        attr = getattr(self.module, name)
+        return profile_phase("espera")(attr) if callable(attr) else attr
+
+
+def enable_profiling(profiler):
+    global PROFILER, messagebox, simpledialog
+    PROFILER = profiler
+    tk.CallWrapper = ProfiledCallWrapper
+    if not isinstance(messagebox, ProfiledDialogs):
+        messagebox = ProfiledDialogs(messagebox)
+        simpledialog = ProfiledDialogs(simpledialog)
 
-    def run_query(self, query, parameters=()):
-        with sqlite3.connect(self.db_name) as conn:
-            cursor = conn.cursor()
-            try:
-                result = cursor.execute(query, parameters)
-                conn.commit()
-                return result
-            except sqlite3.Error as e:
-                print(f"Error de BD: {e}")
-                return None
 
-    def init_db(self):
-        # Crear Tablas
-        self.run_query("""
+class DatabaseManager:
+    # Montos (precio_base, total, precio_unitario_aplicado, subtotal) en centavos
+    TABLAS = {
+        "usuarios": """
             CREATE TABLE IF NOT EXISTS usuarios (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 nombre TEXT NOT NULL UNIQUE,
                 password TEXT NOT NULL,
                 rol TEXT NOT NULL
             )
-        """)
-        self.run_query("""
+        """,
+        "productos": """
             CREATE TABLE IF NOT EXISTS productos (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 nombre TEXT NOT NULL UNIQUE,
-                precio_base REAL NOT NULL
+                precio_base INTEGER NOT NULL
             )
-        """)
-        self.run_query("""
+        """,
+        "ventas": """
             CREATE TABLE IF NOT EXISTS ventas (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 correlativo INTEGER NOT NULL,
                 fecha_hora TEXT NOT NULL,
-                total REAL NOT NULL,
+                total INTEGER NOT NULL,
                 usuario_responsable TEXT NOT NULL
             )
-        """)
-        self.run_query("""
+        """,
+        "detalle_ventas": """
             CREATE TABLE IF NOT EXISTS detalle_ventas (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 id_venta INTEGER NOT NULL,
                 producto TEXT NOT NULL,
                 cantidad INTEGER NOT NULL,
-                precio_unitario_aplicado REAL NOT NULL,
-                subtotal REAL NOT NULL,
+                precio_unitario_aplicado INTEGER NOT NULL,
+                subtotal INTEGER NOT NULL,
                 FOREIGN KEY(id_venta) REFERENCES ventas(id)
             )
-        """)
+        """,
+    }
+
+    def __init__(self, db_name="restaurante.db"):
+        self.db_name = db_name
+        self.init_db()
+
+    @profile_phase("db")
+    def run_query(self, query, parameters=(), fetch=None):
+        # fetch="one"/"all" lee las filas aquí, para que la lectura cuente como tiempo de BD
+        with sqlite3.connect(self.db_name) as conn:
+            cursor = conn.cursor()
+            try:
+                result = cursor.execute(query, parameters)
+                conn.commit()
+                if fetch == "one": return result.fetchone()
+                if fetch == "all": return result.fetchall()
+                return result
+            except sqlite3.Error as e:
+                print(f"Error de BD: {e}")
+                return None
+
+    def init_db(self):
+        self.migrate_money_to_cents()
+        # Crear Tablas
+        for ddl in self.TABLAS.values():
+            self.run_query(ddl)
         
         # DATOS SEMILLA (Usuarios Actualizados)
         # Borramos admin previo para asegurar
@@ -85,18 +300,43 @@ class DatabaseManager:
             self.run_query("INSERT OR IGNORE INTO usuarios (nombre, password, rol) VALUES (?, ?, ?)", (u, p, r))
         
         # Productos iniciales
-        if not self.run_query("SELECT * FROM productos").fetchone():
-            items = [("Cafe", 5.00), ("Pastel Chocolate", 20.00), 
-                     ("Desayuno Chapin", 45.00), ("Licuado", 15.00), ("Coca Cola", 15.00)]
+        if not self.run_query("SELECT * FROM productos", fetch="one"):
+            items = [("Cafe", 500), ("Pastel Chocolate", 2000), 
+                     ("Desayuno Chapin", 4500), ("Licuado", 1500), ("Coca Cola", 1500)]
             for nombre, precio in items:
                 self.run_query("INSERT OR IGNORE INTO productos (nombre, precio_base) VALUES (?, ?)", (nombre, precio))
 
+    def migrate_money_to_cents(self):
+        # Bases antiguas guardaban los montos como REAL (quetzales); se pasan a centavos.
+        with sqlite3.connect(self.db_name) as conn:
+            tipos = {col[1]: col[2].upper() for col in conn.execute("PRAGMA table_info(productos)")}
+            if tipos.get("precio_base") != "REAL":
+                return
+            conn.execute("BEGIN")
+            for tabla in ("productos", "ventas", "detalle_ventas"):
+                conn.execute(f"ALTER TABLE {tabla} RENAME TO {tabla}_real")
+                conn.execute(self.TABLAS[tabla])
+            conn.execute("""
+                INSERT INTO productos (id, nombre, precio_base)
+                SELECT id, nombre, CAST(ROUND(precio_base * 100) AS INTEGER) FROM productos_real
+            """)
+            conn.execute("""
+                INSERT INTO ventas (id, correlativo, fecha_hora, total, usuario_responsable)
+                SELECT id, correlativo, fecha_hora, CAST(ROUND(total * 100) AS INTEGER), usuario_responsable FROM ventas_real
+            """)
+            conn.execute("""
+                INSERT INTO detalle_ventas (id, id_venta, producto, cantidad, precio_unitario_aplicado, subtotal)
+                SELECT id, id_venta, producto, cantidad, CAST(ROUND(precio_unitario_aplicado * 100) AS INTEGER),
+                       CAST(ROUND(subtotal * 100) AS INTEGER) FROM detalle_ventas_real
+            """)
+            for tabla in ("detalle_ventas", "ventas", "productos"):
+                conn.execute(f"DROP TABLE {tabla}_real")
+
     def login(self, user, pwd):
-        res = self.run_query("SELECT nombre, rol FROM usuarios WHERE nombre=? AND password=?", (user, pwd))
-        return res.fetchone()
+        return self.run_query("SELECT nombre, rol FROM usuarios WHERE nombre=? AND password=?", (user, pwd), fetch="one")
 
     def get_products(self):
-        return self.run_query("SELECT id, nombre, precio_base FROM productos").fetchall()
+        return self.run_query("SELECT id, nombre, precio_base FROM productos", fetch="all")
 
     def add_product(self, nombre, precio):
         try:
@@ -109,16 +349,16 @@ class DatabaseManager:
         self.run_query("DELETE FROM productos WHERE id=?", (id_prod,))
 
     def get_next_correlative(self):
-        res = self.run_query("SELECT MAX(correlativo) FROM ventas").fetchone()
+        res = self.run_query("SELECT MAX(correlativo) FROM ventas", fetch="one")
         if res[0] is None: return 1
         return res[0] + 1
 
     # --- FUNCIONES DE EDICIÓN ---
     def get_sale_by_correlative(self, correlativo):
-        venta = self.run_query("SELECT id, total, usuario_responsable, fecha_hora FROM ventas WHERE correlativo=?", (correlativo,)).fetchone()
+        venta = self.run_query("SELECT id, total, usuario_responsable, fecha_hora FROM ventas WHERE correlativo=?", (correlativo,), fetch="one")
         if not venta: return None
         id_venta = venta[0]
-        detalles = self.run_query("SELECT producto, cantidad, precio_unitario_aplicado, subtotal FROM detalle_ventas WHERE id_venta=?", (id_venta,)).fetchall()
+        detalles = self.run_query("SELECT producto, cantidad, precio_unitario_aplicado, subtotal FROM detalle_ventas WHERE id_venta=?", (id_venta,), fetch="all")
         items_list = [list(d) for d in detalles]
         return (id_venta, venta[1], venta[2], venta[3], items_list)
 
@@ -145,7 +385,7 @@ class DatabaseManager:
         return True
 
     def delete_sale(self, correlativo):
-        res = self.run_query("SELECT id FROM ventas WHERE correlativo=?", (correlativo,)).fetchone()
+        res = self.run_query("SELECT id FROM ventas WHERE correlativo=?", (correlativo,), fetch="one")
         if res:
             id_venta = res[0]
             self.run_query("DELETE FROM detalle_ventas WHERE id_venta=?", (id_venta,))
@@ -154,12 +394,15 @@ class DatabaseManager:
         return False
 
     def get_ventas_reporte(self, filtro_hoy=False):
-        query = "SELECT correlativo, fecha_hora, usuario_responsable, total FROM ventas"
+        # Filas y suma exacta (centavos) en la misma consulta, para que siempre coincidan
+        query = "SELECT correlativo, fecha_hora, usuario_responsable, total, SUM(total) OVER () FROM ventas"
         if filtro_hoy:
             hoy = datetime.datetime.now().strftime("%Y-%m-%d")
             query += f" WHERE substr(fecha_hora, 1, 10) = '{hoy}'"
         query += " ORDER BY correlativo DESC"
-        return self.run_query(query).fetchall()
+        filas = self.run_query(query, fetch="all")
+        total = filas[0][4] if filas else 0
+        return [fila[:4] for fila in filas], total
 
 
 class LoginFrame(ctk.CTkFrame):
@@ -176,6 +419,7 @@ class LoginFrame(ctk.CTkFrame):
         ctk.CTkButton(self, text="INGRESAR", command=self.attempt_login, font=FONT_BTN, height=50, width=300).pack(pady=30)
         ctk.CTkLabel(self, text="", text_color="gray").pack(pady=10)
 
+    @profile_handler
     def attempt_login(self):
         u = self.user_entry.get()
         p = self.pass_entry.get()
@@ -314,7 +558,7 @@ class SalesFrame(ctk.CTkFrame):
     def on_prod_select(self, choice):
         for p in self.products_raw:
             if p[1] == choice:
-                self.var_price.set(p[2])
+                self.var_price.set(p[2] / 100)
                 break
 
     def on_smart_search(self, event):
@@ -334,12 +578,13 @@ class SalesFrame(ctk.CTkFrame):
                     break
         if found_product:
             self.cb_products.set(found_product[1])
-            self.var_price.set(found_product[2])
+            self.var_price.set(found_product[2] / 100)
             self.entry_qty.focus_set()
             self.entry_qty.select_range(0, tk.END)
         else:
             messagebox.showwarning("No encontrado", f"No existe producto con ID o Nombre: '{inp}'")
 
+    @profile_handler
     def add_to_cart(self):
         prod = self.cb_products.get()
         if prod not in self.prod_names:
@@ -349,7 +594,7 @@ class SalesFrame(ctk.CTkFrame):
 
         try:
             qty = self.var_qty.get()
-            price = self.var_price.get()
+            price = to_cents(self.var_price.get())
         except:
             messagebox.showerror("Error", "Cantidad o Precio inválidos")
             return
@@ -360,13 +605,13 @@ class SalesFrame(ctk.CTkFrame):
         for index, item in enumerate(self.cart_items):
             if item[0] == prod and item[2] == price:
                 new_qty = item[1] + qty
-                new_sub = round(new_qty * price, 2)
+                new_sub = new_qty * price
                 self.cart_items[index] = [prod, new_qty, price, new_sub]
                 found_in_cart = True
                 break
         
         if not found_in_cart:
-            subtotal = round(qty * price, 2)
+            subtotal = qty * price
             self.cart_items.append([prod, qty, price, subtotal])
 
         self.refresh_cart()
@@ -374,6 +619,7 @@ class SalesFrame(ctk.CTkFrame):
         self.var_qty.set(1)
         self.cb_products.focus_set()
 
+    @profile_handler
     def delete_cart_item(self, event):
         sel = self.tree.selection()
         if sel:
@@ -381,16 +627,18 @@ class SalesFrame(ctk.CTkFrame):
             del self.cart_items[idx]
             self.refresh_cart()
 
+    @profile_phase("render")
     def refresh_cart(self):
         for i in self.tree.get_children():
             self.tree.delete(i)
         total_gral = 0
-        for item in self.cart_items:
-            self.tree.insert("", "end", values=item)
-            total_gral += item[3]
-        self.lbl_total.configure(text=f"TOTAL: Q{total_gral:.2f}")
+        for prod, qty, price, subtotal in self.cart_items:
+            self.tree.insert("", "end", values=(prod, qty, format_money(price), format_money(subtotal)))
+            total_gral += subtotal
+        self.lbl_total.configure(text=f"TOTAL: {format_money(total_gral)}")
 
     # --- LÓGICA DE EDICIÓN ---
+    @profile_handler
     def start_edit_ticket(self):
         corr_str = simpledialog.askstring("Modificar Ticket", "Ingrese el Número de Ticket (Correlativo):")
         if not corr_str or not corr_str.isdigit(): return
@@ -422,6 +670,7 @@ class SalesFrame(ctk.CTkFrame):
         self.refresh_cart()
         messagebox.showinfo("Modo Edición", f"Ticket #{corr} cargado.")
 
+    @profile_handler
     def cancel_edit_mode(self):
         self.is_editing = False
         self.editing_id = None
@@ -435,6 +684,7 @@ class SalesFrame(ctk.CTkFrame):
         self.waiter_var.set("Seleccionar Mesero")
         self.update_next_correlative()
 
+    @profile_handler
     def finish_sale(self, print_ticket=True):
         mesero_actual = self.waiter_var.get()
         if mesero_actual == "Seleccionar Mesero":
@@ -469,6 +719,7 @@ class SalesFrame(ctk.CTkFrame):
             else:
                 messagebox.showerror("Error", "No se pudo guardar la venta en BD")
 
+    @profile_phase("io")
     def generate_html_ticket(self, correlative, total, mesero_nombre, reprint=False):
         filename = f"ticket_{correlative}.html"
         file_path = os.path.abspath(filename)
@@ -526,11 +777,11 @@ class SalesFrame(ctk.CTkFrame):
         for item in self.cart_items:
             # Nombre cortado a 10 caracteres
             nombre_corto = (item[0][:10] + '.') if len(item[0]) > 10 else item[0]
-            html_content += f"<tr><td>{nombre_corto}</td><td style='text-align:center'>{item[1]}</td><td class='num'>Q{item[3]:.2f}</td></tr>"
+            html_content += f"<tr><td>{nombre_corto}</td><td style='text-align:center'>{item[1]}</td><td class='num'>{format_money(item[3])}</td></tr>"
 
         html_content += f"""
             </table>
-            <div class="total">TOTAL: Q{total:.2f}</div>
+            <div class="total">TOTAL: {format_money(total)}</div>
             <div class="footer">¡GRACIAS POR SU VISITA!</div>
             <br>
             <div style="text-align: center;">.</div>
@@ -582,16 +833,18 @@ class ManagerFrame(ctk.CTkFrame):
         self.tree_prod.pack(fill="both", expand=True, padx=10, pady=10)
         self.load_products()
 
+    @profile_phase("render")
     def load_products(self):
         for i in self.tree_prod.get_children():
             self.tree_prod.delete(i)
-        for p in self.db.get_products():
-            self.tree_prod.insert("", "end", values=p)
+        for id_prod, nombre, precio in self.db.get_products():
+            self.tree_prod.insert("", "end", values=(id_prod, nombre, format_money(precio)))
 
+    @profile_handler
     def create_prod(self):
         try:
             nom = self.entry_p_name.get()
-            pre = float(self.entry_p_price.get())
+            pre = to_cents(self.entry_p_price.get())
             if nom:
                 if self.db.add_product(nom, pre):
                     self.load_products()
@@ -600,6 +853,7 @@ class ManagerFrame(ctk.CTkFrame):
                 else: messagebox.showerror("Error", "Ese producto ya existe.")
         except ValueError: messagebox.showerror("Error", "Precio inválido")
 
+    @profile_handler
     def delete_prod(self):
         sel = self.tree_prod.selection()
         if sel:
@@ -627,17 +881,18 @@ class ManagerFrame(ctk.CTkFrame):
         self.tree_rep.pack(fill="both", expand=True, padx=10, pady=10)
         self.load_reports()
 
+    @profile_handler
+    @profile_phase("render")
     def load_reports(self):
         for i in self.tree_rep.get_children():
             self.tree_rep.delete(i)
         solo_hoy = True if self.switch_hoy.get() == 1 else False
-        data = self.db.get_ventas_reporte(filtro_hoy=solo_hoy)
-        suma = 0
-        for row in data:
-            self.tree_rep.insert("", "end", values=row)
-            suma += row[3]
-        self.lbl_sum_total.configure(text=f"Total Vendido: Q{suma:.2f}")
+        data, suma = self.db.get_ventas_reporte(filtro_hoy=solo_hoy)
+        for corr, fecha, usuario, total in data:
+            self.tree_rep.insert("", "end", values=(corr, fecha, usuario, format_money(total)))
+        self.lbl_sum_total.configure(text=f"Total Vendido: {format_money(suma)}")
 
+    @profile_handler
     def anular_venta(self):
         sel = self.tree_rep.selection()
         if not sel:
@@ -650,18 +905,34 @@ class ManagerFrame(ctk.CTkFrame):
                 self.load_reports()
 
 class App(ctk.CTk):
-    def __init__(self):
+    HEARTBEAT_MS = 50
+
+    def __init__(self, profiler=None):
+        self.profiler = profiler
+        if profiler:
+            # Antes de crear widgets, para que todos sus callbacks queden medidos
+            enable_profiling(profiler)
         super().__init__()
         self.title("Sistema POS - Dolce Vita")
         self.geometry("1024x768")
         self.db = DatabaseManager()
         self.current_frame = None
         self.show_login()
+        if profiler:
+            profiler.ignored.add(f"after: {self.heartbeat.__name__}")
+            self.heartbeat()
+
+    def heartbeat(self, previous=None):
+        now = time.perf_counter()
+        if previous is not None:
+            self.profiler.check_stall(previous, now, self.HEARTBEAT_MS)
+        self.after(self.HEARTBEAT_MS, self.heartbeat, now)
 
     def switch_frame(self, frame_class, **kwargs):
         if self.current_frame: self.current_frame.destroy()
         self.current_frame = frame_class(self, **kwargs)
 
+    @profile_handler
     def show_login(self):
         self.switch_frame(LoginFrame, login_callback=self.verify_login)
 
@@ -680,5 +951,18 @@ class App(ctk.CTk):
         self.switch_frame(ManagerFrame, db=self.db, logout_cb=self.show_login)
 
 if __name__ == "__main__":
-    app = App()
-    app.mainloop()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Sistema POS - Dolce Vita")
+    parser.add_argument("--perfil", nargs="?", const="perfil_ui.json", metavar="ARCHIVO",
+                        help="Medir tiempos de la interfaz y guardar la traza en ARCHIVO")
+    parser.add_argument("--umbral-ms", type=int, default=100,
+                        help="Duración a partir de la cual un callback cuenta como bloqueo")
+    args = parser.parse_args()
+
+    profiler = UIProfiler(args.perfil, args.umbral_ms) if args.perfil else None
+    app = App(profiler=profiler)
+    try:
+        app.mainloop()
+    finally:
+        if profiler:
+            print(profiler.summary())
+            print(f"Traza guardada en: {profiler.export()}")
\ No newline at end of file
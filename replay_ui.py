@@ -0,0 +1,160 @@
+"""Reproduce acciones de SalesFrame y ManagerFrame sin pantalla (sin Tk ni Xvfb).
+
+Los widgets se reemplazan por objetos falsos y se ejecutan los métodos reales de
+las pantallas, así que se mide el costo en Python (BD, armado de tablas, tickets)
+pero no el dibujo de Tk. Sirve para comparar versiones y detectar regresiones.
+
+Uso: python replay_ui.py --ventas 500 --salida replay_ui.json
+"""
+import argparse
+import os
+import random
+import tempfile
+import types
+
+import main
+
+
+class FakeWidget:
+    # Acepta cualquier llamada de widget (pack, focus_set...) y guarda el valor/configuración
+    def __init__(self, value=""):
+        self.value = value
+        self.options = {}
+
+    def get(self):
+        return self.value
+
+    def set(self, value):
+        self.value = value
+
+    def configure(self, **kwargs):
+        self.options.update(kwargs)
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: None
+
+
+class FakeTree(FakeWidget):
+    def __init__(self):
+        super().__init__()
+        self.rows = {}
+        self.next_id = 0
+
+    def insert(self, parent, index, values=()):
+        self.next_id += 1
+        iid = f"I{self.next_id}"
+        self.rows[iid] = values
+        return iid
+
+    def delete(self, *iids):
+        for iid in iids:
+            self.rows.pop(iid, None)
+
+    def get_children(self, item=""):
+        return tuple(self.rows)
+
+    def item(self, iid):
+        return {"values": list(self.rows[iid])}
+
+    def index(self, iid):
+        return list(self.rows).index(iid)
+
+    def selection(self):
+        return ()
+
+
+def headless(frame_class):
+    # Clase sin Tk que reutiliza los métodos reales de la pantalla (sin su __init__)
+    methods = {k: v for k, v in vars(frame_class).items() if callable(v) and k != "__init__"}
+    return type(f"Headless{frame_class.__name__}", (), methods)()
+
+
+def build_sales_frame(db):
+    frame = headless(main.SalesFrame)
+    frame.db = db
+    frame.user_info = {"nombre": "pruebamesero", "rol": "mesero"}
+    frame.cart_items = []
+    frame.is_editing = False
+    frame.editing_id = None
+    frame.editing_correlative = None
+    frame.products_raw = db.get_products()
+    frame.prod_names = [p[1] for p in frame.products_raw]
+    frame.waiter_var = FakeWidget("ANA")
+    frame.cb_products = FakeWidget("")
+    frame.var_price = FakeWidget(0.0)
+    frame.var_qty = FakeWidget(1)
+    for name in ("entry_qty", "lbl_mode", "lbl_total", "lbl_next_correlative", "btn_finish", "btn_cancel_edit"):
+        setattr(frame, name, FakeWidget())
+    frame.tree = FakeTree()
+    return frame
+
+
+def build_manager_frame(db):
+    frame = headless(main.ManagerFrame)
+    frame.db = db
+    frame.switch_hoy = FakeWidget(0)
+    frame.lbl_sum_total = FakeWidget()
+    frame.tree_prod = FakeTree()
+    frame.tree_rep = FakeTree()
+    return frame
+
+
+def replay(profiler, ventas, items_por_venta, imprimir_cada):
+    rnd = random.Random(0)
+    db = main.DatabaseManager(os.path.join(os.getcwd(), "replay.db"))
+    sales = build_sales_frame(db)
+
+    for n in range(ventas):
+        for _ in range(items_por_venta):
+            with profiler.handler("SalesFrame.add_to_cart"):
+                prod = rnd.choice(sales.prod_names)
+                sales.cb_products.set(prod)
+                sales.on_prod_select(prod)
+                sales.var_qty.set(rnd.randint(1, 3))
+                sales.add_to_cart()
+        imprimir = imprimir_cada > 0 and n % imprimir_cada == 0
+        with profiler.handler("SalesFrame.finish_sale"):
+            sales.finish_sale(print_ticket=imprimir)
+
+    manager = build_manager_frame(db)
+    with profiler.handler("ManagerFrame.load_products"):
+        manager.load_products()
+    for solo_hoy in (0, 1):
+        manager.switch_hoy.set(solo_hoy)
+        with profiler.handler("ManagerFrame.load_reports"):
+            manager.load_reports()
+    return manager.lbl_sum_total.options.get("text")
+
+
+def main_cli():
+    parser = argparse.ArgumentParser(description="Replay sin pantalla de las pantallas del POS")
+    parser.add_argument("--ventas", type=int, default=200)
+    parser.add_argument("--items", type=int, default=4, help="Productos agregados por venta")
+    parser.add_argument("--imprimir-cada", type=int, default=10, help="Generar ticket HTML cada N ventas (0 = nunca)")
+    parser.add_argument("--umbral-ms", type=int, default=100)
+    parser.add_argument("--salida", default="replay_ui.json")
+    args = parser.parse_args()
+
+    salida = os.path.abspath(args.salida)
+    profiler = main.UIProfiler(salida, args.umbral_ms)
+    main.enable_profiling(profiler)
+    # Diálogos y navegador no tienen sentido sin pantalla
+    main.messagebox = types.SimpleNamespace(showinfo=lambda *a: None, showwarning=lambda *a: None,
+                                            showerror=lambda *a: None, askyesno=lambda *a: True)
+    main.webbrowser = types.SimpleNamespace(open_new_tab=lambda path: None)
+
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)  # base de datos y tickets temporales
+        try:
+            total = replay(profiler, args.ventas, args.items, args.imprimir_cada)
+        finally:
+            os.chdir(cwd)
+
+    print(profiler.summary())
+    print(total)
+    print(f"Traza guardada en: {profiler.export()}")
+
+
+if __name__ == "__main__":
+    main_cli()
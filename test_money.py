@@ -0,0 +1,80 @@
+import sqlite3
+
+import pytest
+
+import main
+
+
+@pytest.mark.parametrize("monto, centavos", [("19.99", 1999), ("6.663", 666), ("2.345", 235), (5.0, 500), (" 0.1 ", 10)])
+def test_to_cents(monto, centavos):
+    assert main.to_cents(monto) == centavos
+
+
+@pytest.mark.parametrize("monto", ["", "abc", "inf", "-inf", "nan", "sNaN", "1e400"])
+def test_to_cents_invalido(monto):
+    with pytest.raises(ValueError, match="Monto inválido"):
+        main.to_cents(monto)
+
+
+def test_format_money():
+    assert main.format_money(1999) == "Q19.99"
+    assert main.format_money(5) == "Q0.05"
+    assert main.format_money(-250) == "-Q2.50"
+
+
+def crear_bd_real(path):
+    # Esquema anterior: montos REAL en quetzales
+    with sqlite3.connect(path) as conn:
+        conn.executescript("""
+            CREATE TABLE usuarios (id INTEGER PRIMARY KEY AUTOINCREMENT, nombre TEXT NOT NULL UNIQUE,
+                                   password TEXT NOT NULL, rol TEXT NOT NULL);
+            CREATE TABLE productos (id INTEGER PRIMARY KEY AUTOINCREMENT, nombre TEXT NOT NULL UNIQUE,
+                                    precio_base REAL NOT NULL);
+            CREATE TABLE ventas (id INTEGER PRIMARY KEY AUTOINCREMENT, correlativo INTEGER NOT NULL,
+                                 fecha_hora TEXT NOT NULL, total REAL NOT NULL, usuario_responsable TEXT NOT NULL);
+            CREATE TABLE detalle_ventas (id INTEGER PRIMARY KEY AUTOINCREMENT, id_venta INTEGER NOT NULL,
+                                         producto TEXT NOT NULL, cantidad INTEGER NOT NULL,
+                                         precio_unitario_aplicado REAL NOT NULL, subtotal REAL NOT NULL,
+                                         FOREIGN KEY(id_venta) REFERENCES ventas(id));
+            INSERT INTO productos (nombre, precio_base) VALUES ('Cafe', 19.99), ('Licuado', 6.663);
+            INSERT INTO ventas VALUES (1, 1, '2024-01-01 10:00:00', 26.65, 'ANA');
+            INSERT INTO ventas VALUES (2, 2, '2024-01-01 11:00:00', 0.3, 'ELDER');
+            INSERT INTO detalle_ventas VALUES (1, 1, 'Cafe', 1, 19.99, 19.99);
+            INSERT INTO detalle_ventas VALUES (2, 1, 'Licuado', 1, 6.663, 6.663);
+            INSERT INTO detalle_ventas VALUES (3, 2, 'Cafe', 3, 0.1, 0.3);
+        """)
+
+
+def tipos(path, tabla):
+    with sqlite3.connect(path) as conn:
+        return {col[1]: col[2] for col in conn.execute(f"PRAGMA table_info({tabla})")}
+
+
+def test_migracion_a_centavos(tmp_path):
+    path = str(tmp_path / "antigua.db")
+    crear_bd_real(path)
+
+    db = main.DatabaseManager(path)
+
+    assert tipos(path, "productos")["precio_base"] == "INTEGER"
+    assert tipos(path, "ventas")["total"] == "INTEGER"
+    assert tipos(path, "detalle_ventas")["precio_unitario_aplicado"] == "INTEGER"
+    assert tipos(path, "detalle_ventas")["subtotal"] == "INTEGER"
+    assert db.get_products() == [(1, "Cafe", 1999), (2, "Licuado", 666)]
+    assert db.get_sale_by_correlative(1) == (1, 2665, "ANA", "2024-01-01 10:00:00",
+                                             [["Cafe", 1, 1999, 1999], ["Licuado", 1, 666, 666]])
+    filas, total = db.get_ventas_reporte()
+    assert [f[3] for f in filas] == [30, 2665]
+    assert total == 2695
+    assert main.format_money(total) == "Q26.95"
+
+    # Un segundo arranque no vuelve a multiplicar los montos
+    db = main.DatabaseManager(path)
+    assert db.get_products() == [(1, "Cafe", 1999), (2, "Licuado", 666)]
+    assert db.get_ventas_reporte()[1] == 2695
+
+
+def test_reporte_vacio(tmp_path):
+    db = main.DatabaseManager(str(tmp_path / "nueva.db"))
+    assert tipos(db.db_name, "ventas")["total"] == "INTEGER"
+    assert db.get_ventas_reporte(filtro_hoy=True) == ([], 0)
@@ -0,0 +1,80 @@
+import main
+
+
+def perfilador():
+    profiler = main.UIProfiler(threshold_ms=100)
+    profiler.t0 = 0.0
+    return profiler
+
+
+def callback(name, fases=None):
+    return {"name": name, "entry": True, "eventos": [], "fases": fases or {}}
+
+
+def test_callback_lento_es_bloqueo():
+    profiler = perfilador()
+    profiler._finish_handler(0.0, 0.3, callback("finish_sale", {"db": 280.0}))
+    st = profiler.stats["finish_sale"]
+    assert st["bloqueos"] == 1
+    assert round(st["max_ms"]) == 300
+
+
+def test_espera_en_dialogo_no_es_bloqueo():
+    profiler = perfilador()
+    # 2 s con un messagebox abierto, 50 ms de trabajo real
+    profiler._finish_handler(0.0, 2.05, callback("finish_sale", {"db": 50.0, "espera": 2000.0}))
+    st = profiler.stats["finish_sale"]
+    assert st["bloqueos"] == 0
+    assert round(st["total_ms"]) == round(st["max_ms"]) == 50
+    assert st["fases_ms"]["espera"] == 2000.0
+
+
+def bloqueos_del_bucle(profiler):
+    return [e for e in profiler.events if e["cat"] == "stall"]
+
+
+def test_latido_tarde_sin_callbacks_es_bloqueo():
+    profiler = perfilador()
+    # Latido esperado en 0.05 s, llegó en 0.30 s
+    profiler.check_stall(0.0, 0.30, 50)
+    (stall,) = bloqueos_del_bucle(profiler)
+    assert stall["args"] == {"retraso_ms": 250, "sin_atribuir_ms": 250}
+
+
+def test_latido_tarde_explicado_por_callback_no_se_repite():
+    profiler = perfilador()
+    profiler._finish_handler(0.05, 0.30, callback("finish_sale"))
+    profiler.check_stall(0.0, 0.30, 50)
+    assert bloqueos_del_bucle(profiler) == []
+
+
+def test_varios_callbacks_cortos_explican_el_retraso():
+    profiler = perfilador()
+    profiler._finish_handler(0.10, 0.20, callback("add_to_cart"))
+    profiler._finish_handler(0.20, 0.30, callback("refresh_cart"))
+    profiler.check_stall(0.0, 0.30, 50)  # 250 ms de retraso, 200 ms cubiertos
+    assert bloqueos_del_bucle(profiler) == []
+
+
+def test_callback_anterior_al_intervalo_no_se_descuenta():
+    profiler = perfilador()
+    profiler._finish_handler(0.0, 0.04, callback("add_to_cart"))
+    profiler.check_stall(0.0, 0.30, 50)
+    (stall,) = bloqueos_del_bucle(profiler)
+    assert stall["args"]["sin_atribuir_ms"] == 250
+
+
+def test_callback_largo_cubre_varios_latidos():
+    profiler = perfilador()
+    # Diálogo abierto desde 0.0 s: los latidos tardíos mientras sigue en curso no son bloqueos
+    profiler._handlers.append(callback("start_edit_ticket") | {"start": 0.0})
+    profiler.check_stall(0.0, 0.50, 50)
+    profiler.check_stall(0.50, 1.50, 50)
+    profiler._handlers.pop()
+    profiler._finish_handler(0.0, 1.60, callback("start_edit_ticket", {"espera": 1550.0}))
+    profiler.check_stall(1.50, 1.60, 50)
+    assert bloqueos_del_bucle(profiler) == []
+    # Después del callback, un retraso sin explicación sí se reporta completo
+    profiler.check_stall(1.60, 1.90, 50)
+    (stall,) = bloqueos_del_bucle(profiler)
+    assert stall["args"]["sin_atribuir_ms"] == 250